@@ -207,6 +207,10 @@ class Signature:
         self._registers = tuple(registers)
         self._lefts = _dedupe((reg.name, reg) for reg in self._registers if reg.side & Side.LEFT)
         self._rights = _dedupe((reg.name, reg) for reg in self._registers if reg.side & Side.RIGHT)
+        # Precomputed so the frequently called `lefts()` / `rights()` accessors return a
+        # C-level tuple instead of spinning up a generator per call.
+        self._left_regs = tuple(self._lefts.values())
+        self._right_regs = tuple(self._rights.values())
 
     @classmethod
     def build(cls, *args, **kwargs) -> 'Signature':
@@ -358,13 +362,13 @@ class Signature:
                 return False
         return True
 
-    def lefts(self) -> Iterable[Register]:
-        """Iterable over all registers that appear on the LEFT as input."""
-        yield from self._lefts.values()
+    def lefts(self) -> Tuple[Register, ...]:
+        """All registers that appear on the LEFT as input."""
+        return self._left_regs
 
-    def rights(self) -> Iterable[Register]:
-        """Iterable over all registers that appear on the RIGHT as output."""
-        yield from self._rights.values()
+    def rights(self) -> Tuple[Register, ...]:
+        """All registers that appear on the RIGHT as output."""
+        return self._right_regs
 
     def get_left(self, name: str) -> Register:
         """Get a left register by name."""
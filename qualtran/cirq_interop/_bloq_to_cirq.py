@@ -14,14 +14,18 @@
 
 """Qualtran Bloqs to Cirq gates/circuits conversion."""
 
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import functools
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import cachetools
 import cirq
 import networkx as nx
 import numpy as np
 
 from qualtran import (
     Bloq,
+    CompositeBloq,
     Connection,
     DecomposeNotImplementedError,
     DecomposeTypeError,
@@ -34,41 +38,143 @@ from qualtran import (
 )
 from qualtran._infra.binst_graph_iterators import greedy_topological_sort
 from qualtran._infra.composite_bloq import _binst_to_cxns
-from qualtran._infra.gate_with_registers import (
-    _get_all_and_output_quregs_from_input,
-    merge_qubits,
-    split_qubits,
-)
+from qualtran._infra.gate_with_registers import _get_all_and_output_quregs_from_input, merge_qubits
 from qualtran._infra.quantum_graph import _Soquet
 from qualtran.cirq_interop._cirq_to_bloq import _QReg, CirqQuregInT, CirqQuregT
 from qualtran.cirq_interop._interop_qubit_manager import InteropQubitManager
 from qualtran.drawing import Circle, LarrowTextBox, ModPlus, RarrowTextBox, TextBox, WireSymbol
 
 
+@functools.lru_cache(maxsize=512)
+def _memoized_decompose_bloq(bloq: Bloq) -> CompositeBloq:
+    """Memoized `bloq.decompose_bloq()` for repeated cirq-style decompositions.
+
+    Cirq invokes `_decompose_with_context_` once per operation, so repeated subroutines
+    re-derive the same composite bloq over and over. Bloqs are frozen and the resulting
+    `CompositeBloq` is immutable, so the decomposition can be cached per bloq. Callers
+    should fall back to `bloq.decompose_bloq()` on `TypeError` for unhashable bloqs.
+    """
+    return bloq.decompose_bloq()
+
+
 def _cirq_style_decompose_from_decompose_bloq(
     bloq: Bloq, quregs, context: cirq.DecompositionContext
 ) -> cirq.Circuit:
     """Helper function to implement cirq-style `_decompose_with_context_` that relies
     on `Bloq.decompose_bloq()`
     """
-    cbloq = bloq.decompose_bloq()
+    try:
+        cbloq = _memoized_decompose_bloq(bloq)
+    except TypeError:
+        # Unhashable bloq; decompose without caching.
+        cbloq = bloq.decompose_bloq()
     in_quregs = {reg.name: quregs[reg.name] for reg in bloq.signature.lefts()}
-    # Input qubits can get de-allocated by cbloq.to_cirq_circuit_and_quregs, thus mark them as managed.
+    # Input qubits can get de-allocated by cbloq.to_cirq_circuit_and_quregs, thus mark them as
+    # managed. The quregs come from `split_qubits` (or `bloq_on`'s cache) with validated shapes,
+    # so flatten them directly instead of paying `merge_qubits`'s per-register checks.
     qm = InteropQubitManager(context.qubit_manager)
-    qm.manage_qubits(merge_qubits(bloq.signature.lefts(), **in_quregs))
+    qm.manage_qubits(q for qureg in in_quregs.values() for q in qureg.flat)
     circuit, out_quregs = _cbloq_to_cirq_circuit(
         cbloq.signature, in_quregs, cbloq._binst_graph, qubit_manager=qm
     )
-    qubit_map = {q: q for q in circuit.all_qubits()}
+    qubit_map: Dict[cirq.Qid, cirq.Qid] = {}
     for reg in bloq.signature.rights():
-        if reg.side == Side.RIGHT:
+        if reg.side is Side.RIGHT:
             # Right only registers can get mapped to newly allocated output qubits in `out_regs`.
             # Map them back to the original system qubits and deallocate newly allocated qubits.
             assert reg.name in quregs and reg.name in out_quregs
             assert quregs[reg.name].shape == out_quregs[reg.name].shape
-            qm.qfree([q for q in out_quregs[reg.name].flatten()])
-            qubit_map |= zip(out_quregs[reg.name].flatten(), quregs[reg.name].flatten())
-    return circuit.unfreeze(copy=False).transform_qubits(qubit_map)
+            out_qubits = out_quregs[reg.name].flatten()
+            qm.qfree(list(out_qubits))
+            qubit_map.update(zip(out_qubits, quregs[reg.name].flatten()))
+    if not qubit_map:
+        return circuit.unfreeze(copy=False)
+    # Only the right-only registers need remapping; all other qubits map to themselves.
+    return circuit.unfreeze(copy=False).transform_qubits(lambda q: qubit_map.get(q, q))
+
+
+_QUREGS_CACHE: cachetools.LRUCache = cachetools.LRUCache(maxsize=256)
+"""Maps `(bloq, qubits)` to the qureg dict `split_qubits(bloq.signature, qubits)`.
+
+`bloq_on` merges a qureg dict into a flat qubit tuple and `_decompose_with_context_`
+immediately splits it back; seeding this cache in `bloq_on` lets the decomposition
+reuse the original dict instead of re-partitioning the qubits."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _signature_layout(signature: Signature) -> Tuple[Tuple[str, int, int, Tuple[int, ...]], ...]:
+    """Precomputed `(name, start, stop, shape)` slices for partitioning a flat qubit tuple.
+
+    The layout is a pure function of the (immutable, hashable) signature, so it is computed
+    once instead of re-walking the registers on every `_decompose_with_context_` call.
+    """
+    layout = []
+    base = 0
+    for reg in signature:
+        n = reg.total_bits()
+        layout.append((reg.name, base, base + n, reg.shape + (reg.bitsize,)))
+        base += n
+    return tuple(layout)
+
+
+def _split_qubits_fast(signature: Signature, qubits: Sequence[cirq.Qid]) -> Dict[str, 'CirqQuregT']:
+    """`split_qubits` using the cached `_signature_layout` instead of walking the registers."""
+    return {
+        name: np.asarray(qubits[start:stop], dtype=object).reshape(shape)
+        for name, start, stop, shape in _signature_layout(signature)
+    }
+
+
+def _quregs_for_qubits(bloq: Bloq, qubits: Sequence[cirq.Qid]) -> Dict[str, 'CirqQuregT']:
+    """Split `qubits` into quregs for `bloq.signature`, consulting `_QUREGS_CACHE`."""
+    try:
+        key = (bloq, tuple(qubits))
+        quregs = _QUREGS_CACHE.get(key)
+    except TypeError:
+        # Unhashable bloq; fall back to splitting directly.
+        return _split_qubits_fast(bloq.signature, qubits)
+    if quregs is None:
+        quregs = _split_qubits_fast(bloq.signature, qubits)
+        _QUREGS_CACHE[key] = quregs
+    return quregs
+
+
+_UNITARY_CACHE: cachetools.LRUCache = cachetools.LRUCache(maxsize=1024)
+"""Maps a bloq to its contracted unitary, or `NotImplemented` if contraction is unsupported."""
+
+
+def _contract_unitary(bloq: Bloq):
+    """Contract `bloq`'s tensor network, returning `NotImplemented` if unsupported."""
+    try:
+        tensor = bloq.tensor_contract()
+    except (DecomposeNotImplementedError, DecomposeTypeError, NotImplementedError):
+        return NotImplemented
+    assert tensor.ndim == 2, "All registers should have been checked to be THRU."
+    return tensor
+
+
+def _cached_unitary(bloq: Bloq):
+    """Memoized tensor contraction backing `BloqAsCirqGate._unitary_`.
+
+    Cirq protocols query `_unitary_` repeatedly during circuit construction, diagram
+    rendering, and simulation. Bloqs are frozen and hashable, so the contracted tensor
+    (or the fact that contraction is unsupported) is cached per bloq instead of
+    re-contracting on every protocol query; unhashable bloqs skip the cache.
+    `_has_unitary_` peeks at `_UNITARY_CACHE` directly so a yes/no query never forces
+    a contraction.
+
+    Returns the contracted unitary as an ndarray, or `NotImplemented` if the bloq
+    does not support tensor contraction.
+    """
+    try:
+        tensor = _UNITARY_CACHE.get(bloq)
+    except TypeError:
+        # Unhashable bloq; contract without caching.
+        return _contract_unitary(bloq)
+    if tensor is None:
+        tensor = _contract_unitary(bloq)
+        _UNITARY_CACHE[bloq] = tensor
+    return tensor
 
 
 class BloqAsCirqGate(cirq.Gate):
@@ -87,6 +193,10 @@ class BloqAsCirqGate(cirq.Gate):
                     f" Found {regs}\n. Please override `bloq.as_cirq_op` for `{bloq=}` instead."
                 )
         self._bloq = bloq
+        self._hash: Optional[int] = None
+        # The signature is frozen, so the THRU-ness check backing the unitary protocols
+        # can be answered in O(1) per query instead of scanning the registers each time.
+        self._all_thru = bloq.signature.thru_registers_only
 
     @property
     def bloq(self) -> Bloq:
@@ -119,6 +229,12 @@ class BloqAsCirqGate(cirq.Gate):
             bloq.signature, qubit_manager, in_quregs=cirq_quregs
         )
         cirq_op = BloqAsCirqGate(bloq=bloq).on(*merge_qubits(bloq.signature, **all_quregs))
+        try:
+            # `all_quregs` is exactly `split_qubits(bloq.signature, cirq_op.qubits)`; stash it
+            # so a later `_decompose_with_context_` doesn't have to redo the partition.
+            _QUREGS_CACHE[(bloq, cirq_op.qubits)] = all_quregs
+        except TypeError:
+            pass  # Unhashable bloq.
         return cirq_op, out_quregs
 
     def _num_qubits_(self) -> int:
@@ -127,7 +243,7 @@ class BloqAsCirqGate(cirq.Gate):
     def _decompose_with_context_(
         self, qubits: Sequence[cirq.Qid], context: Optional[cirq.DecompositionContext] = None
     ) -> cirq.OP_TREE:
-        quregs = split_qubits(self.bloq.signature, qubits)
+        quregs = _quregs_for_qubits(self._bloq, qubits)
         if context is None:
             context = cirq.DecompositionContext(cirq.ops.SimpleQubitManager())
         try:
@@ -141,14 +257,26 @@ class BloqAsCirqGate(cirq.Gate):
     def _decompose_(self, qubits: Sequence[cirq.Qid]) -> cirq.OP_TREE:
         return self._decompose_with_context_(qubits)
 
+    def _has_unitary_(self):
+        if not self._all_thru:
+            # A decomposable allocating gate can still act unitarily on its full qubit
+            # set, so defer to Cirq's protocol cascade (e.g. the decompose strategy).
+            return NotImplemented
+        try:
+            unitary = _UNITARY_CACHE.get(self._bloq)
+        except TypeError:
+            # Unhashable bloq; nothing cached to consult.
+            return NotImplemented
+        if unitary is None or unitary is NotImplemented:
+            # Nothing cached, or tensor contraction is unsupported — neither implies the
+            # gate is non-unitary (its cirq decomposition may still be). Don't force a
+            # potentially huge contraction for a yes/no query; defer to the cascade.
+            return NotImplemented
+        return True
+
     def _unitary_(self):
-        if all(reg.side == Side.THRU for reg in self.bloq.signature):
-            try:
-                tensor = self.bloq.tensor_contract()
-                assert tensor.ndim == 2, "All registers should have been checked to be THRU."
-                return tensor
-            except (DecomposeNotImplementedError, DecomposeTypeError, NotImplementedError):
-                return NotImplemented
+        if self._all_thru:
+            return _cached_unitary(self._bloq)
         return NotImplemented
 
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
@@ -177,7 +305,11 @@ class BloqAsCirqGate(cirq.Gate):
         return self.bloq == other.bloq
 
     def __hash__(self):
-        return hash(self.bloq)
+        # Cirq hashes gates repeatedly during circuit construction; hashing a deep
+        # composite bloq walks its whole attrs tree, so compute it once and reuse.
+        if self._hash is None:
+            self._hash = hash(self._bloq)
+        return self._hash
 
     def __str__(self) -> str:
         return f'bloq.{self.bloq}'
@@ -189,8 +321,7 @@ class BloqAsCirqGate(cirq.Gate):
 def _track_soq_name_changes(cxns: Iterable[Connection], qvar_to_qreg: Dict[_Soquet, _QReg]):
     """Track inter-Bloq name changes across the two ends of a connection."""
     for cxn in cxns:
-        qvar_to_qreg[cxn.right] = qvar_to_qreg[cxn.left]
-        del qvar_to_qreg[cxn.left]
+        qvar_to_qreg[cxn.right] = qvar_to_qreg.pop(cxn.left)
 
 
 def _bloq_to_cirq_op(
@@ -200,33 +331,76 @@ def _bloq_to_cirq_op(
     qvar_to_qreg: Dict[_Soquet, _QReg],
     qubit_manager: cirq.QubitManager,
 ) -> Optional[cirq.Operation]:
-    _track_soq_name_changes(pred_cxns, qvar_to_qreg)
-    in_quregs: Dict[str, CirqQuregT] = {
-        reg.name: np.empty((*reg.shape, reg.bitsize), dtype=object)
-        for reg in bloq.signature.lefts()
-    }
-    # Construct the cirq qubit registers using input / output connections.
-    # 1. All input Soquets should already have the correct mapping in `qvar_to_qreg`.
+    in_quregs: Dict[str, CirqQuregT] = {}
+    # Construct the cirq qubit registers using input / output connections in a single fused
+    # pass: rename each soquet across the connection (see `_track_soq_name_changes`), build
+    # the input quregs, and drop entries for consumed LEFT registers — without re-hashing
+    # every soquet in a second pass. Every left soquet has exactly one predecessor
+    # connection, so this covers all left registers.
     for cxn in pred_cxns:
         soq = cxn.right
-        assert soq in qvar_to_qreg, f"{soq=} should exist in {qvar_to_qreg=}."
-        in_quregs[soq.reg.name][soq.idx] = qvar_to_qreg[soq].qubits
-        if soq.reg.side == Side.LEFT:
-            # Remove soquets for LEFT registers from qvar_to_qreg mapping.
-            del qvar_to_qreg[soq]
+        qreg = qvar_to_qreg.pop(cxn.left)
+        reg = soq.reg
+        if reg.side is not Side.LEFT:
+            # THRU registers stay live under the renamed soquet; LEFT registers are
+            # consumed by this bloq and need no further tracking.
+            qvar_to_qreg[soq] = qreg
+        if reg.shape:
+            arr = in_quregs.get(reg.name)
+            if arr is None:
+                arr = np.empty((*reg.shape, reg.bitsize), dtype=object)
+                in_quregs[reg.name] = arr
+            arr[soq.idx] = qreg.qubits
+        else:
+            # Common case: a scalar register. Build the 1-D qubit array in one C call
+            # instead of going through numpy object-array item assignment.
+            in_quregs[reg.name] = np.asarray(qreg.qubits, dtype=object)
 
     op, out_quregs = bloq.as_cirq_op(qubit_manager=qubit_manager, **in_quregs)
     # 2. Update the mappings based on output soquets and `out_quregs`.
     for cxn in succ_cxns:
         soq = cxn.left
         assert soq.reg.name in out_quregs, f"{soq=} should exist in {out_quregs=}."
-        if soq.reg.side == Side.RIGHT:
+        if soq.reg.side is Side.RIGHT:
             if not isinstance(soq.reg.dtype, QDType):
                 raise ValueError(f"Output classical wires are not supported in Cirq. {soq=}")
             qvar_to_qreg[soq] = _QReg(out_quregs[soq.reg.name][soq.idx], dtype=soq.reg.dtype)
     return op
 
 
+_GREEDY_TOPO_SORT_CACHE: 'weakref.WeakKeyDictionary[nx.DiGraph, List[Any]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _greedy_topological_sort_cached(binst_graph: nx.DiGraph) -> List[Any]:
+    """Cached `greedy_topological_sort` order for an (immutable) binst graph.
+
+    `_cbloq_to_cirq_circuit` can be invoked repeatedly for the same cbloq (testing,
+    diagram rendering, Cirq protocol queries); the binst graph never changes once the
+    cbloq is built, so the sort order is computed once per graph and held weakly.
+    """
+    order = _GREEDY_TOPO_SORT_CACHE.get(binst_graph)
+    if order is None:
+        order = list(greedy_topological_sort(binst_graph))
+        _GREEDY_TOPO_SORT_CACHE[binst_graph] = order
+    return order
+
+
+def _build_qreg_array(v: 'CirqQuregInT', dtype: QDType) -> np.ndarray:
+    """Construct an object ndarray of `_QReg`s, one per row along the last axis of `v`.
+
+    Equivalent to `np.apply_along_axis(_QReg, -1, v, dtype)` but without the per-slice
+    Python dispatch overhead of `apply_along_axis` on object arrays.
+    """
+    v = np.asarray(v)
+    ret = np.empty(v.shape[:-1], dtype=object)
+    flat = ret.reshape(-1)
+    for i, row in enumerate(v.reshape(-1, v.shape[-1])):
+        flat[i] = _QReg(row, dtype)
+    return ret
+
+
 def _cbloq_to_cirq_circuit(
     signature: Signature,
     cirq_quregs: Dict[str, 'CirqQuregInT'],
@@ -246,16 +420,20 @@ def _cbloq_to_cirq_circuit(
         cirq_quregs: The output mapping from right register names to Cirq qubit arrays.
     """
     cirq_quregs: Dict[str, 'CirqQuregInT'] = {
-        k: np.apply_along_axis(_QReg, -1, *(v, signature.get_left(k).dtype))  # type: ignore
-        for k, v in cirq_quregs.items()
-    }
-    qvar_to_qreg: Dict[_Soquet, _QReg] = {
-        _Soquet(LeftDangle, idx=idx, reg=reg): np.asarray(cirq_quregs[reg.name]).item(idx)
-        for reg in signature.lefts()
-        for idx in reg.all_idxs()
+        k: _build_qreg_array(v, signature.get_left(k).dtype) for k, v in cirq_quregs.items()
     }
-    ops: List[cirq.Operation] = []
-    for binst in greedy_topological_sort(binst_graph):
+    qvar_to_qreg: Dict[_Soquet, _QReg] = {}
+    for reg in signature.lefts():
+        # Already an object ndarray of `_QReg`s courtesy of `_build_qreg_array` above.
+        arr = cirq_quregs[reg.name]
+        for idx in reg.all_idxs():
+            qvar_to_qreg[_Soquet(LeftDangle, idx=idx, reg=reg)] = arr.item(idx)
+    # Preallocate one slot per bloq instance. The node count includes the dangles (either
+    # of which may be absent, e.g. for a cbloq with no left registers), so this bound may
+    # overshoot by up to two slots.
+    ops: List[Optional[cirq.Operation]] = [None] * binst_graph.number_of_nodes()
+    n_ops = 0
+    for binst in _greedy_topological_sort_cached(binst_graph):
         if binst is LeftDangle:
             continue
         pred_cxns, succ_cxns = _binst_to_cxns(binst, binst_graph=binst_graph)
@@ -265,19 +443,47 @@ def _cbloq_to_cirq_circuit(
 
         op = _bloq_to_cirq_op(binst.bloq, pred_cxns, succ_cxns, qvar_to_qreg, qubit_manager)
         if op is not None:
-            ops.append(op)
+            ops[n_ops] = op
+            n_ops += 1
 
     # Find output Cirq quregs using `qvar_to_qreg` mapping for registers in `signature.rights()`.
     def _f_quregs(reg: Register) -> CirqQuregT:
-        ret = np.empty(reg.shape + (reg.bitsize,), dtype=object)
-        for idx in reg.all_idxs():
-            soq = _Soquet(RightDangle, idx=idx, reg=reg)
-            ret[idx] = qvar_to_qreg[soq].qubits
-        return ret
+        if not reg.shape:
+            return np.asarray(qvar_to_qreg[_Soquet(RightDangle, reg=reg)].qubits, dtype=object)
+        # `all_idxs()` yields indices in C order, so one asarray + reshape builds the
+        # nested array without per-index numpy object assignment.
+        flat = [
+            qvar_to_qreg[_Soquet(RightDangle, idx=idx, reg=reg)].qubits for idx in reg.all_idxs()
+        ]
+        return np.asarray(flat, dtype=object).reshape(reg.shape + (reg.bitsize,))
 
     out_quregs = {reg.name: _f_quregs(reg) for reg in signature.rights()}
 
-    return cirq.FrozenCircuit(ops), out_quregs
+    return cirq.FrozenCircuit(ops[:n_ops]), out_quregs
+
+
+_WS_TEXT_DISPATCH = {
+    Circle: lambda ws: '@' if ws.filled else '(0)',
+    TextBox: lambda ws: ws.text,
+    RarrowTextBox: lambda ws: ws.text,
+    LarrowTextBox: lambda ws: ws.text,
+    ModPlus: lambda ws: 'X',
+}
+
+
+def _qualtran_wire_symbols_to_cirq_text(ws: WireSymbol) -> str:
+    """Map a qualtran wire symbol to its cirq diagram text.
+
+    A single type-keyed dict lookup replaces the isinstance cascade that previously ran
+    once per wire symbol; subclasses of the known symbols fall back to an isinstance scan.
+    """
+    f = _WS_TEXT_DISPATCH.get(type(ws))
+    if f is not None:
+        return f(ws)
+    for cls, f in _WS_TEXT_DISPATCH.items():
+        if isinstance(ws, cls):
+            return f(ws)
+    raise NotImplementedError(f"Unknown cirq version of {ws}")
 
 
 def _wire_symbol_to_cirq_diagram_info(
@@ -287,22 +493,10 @@ def _wire_symbol_to_cirq_diagram_info(
     for reg in bloq.signature:
         if reg.shape:
             for ri in reg.all_idxs():
-                for idx in range(reg.bitsize):
-                    wire_symbols.append(bloq.wire_symbol(reg, ri))
+                # The symbol only depends on the register index, not the bit index.
+                wire_symbols.extend([bloq.wire_symbol(reg, ri)] * reg.bitsize)
         else:
             wire_symbols.extend([bloq.wire_symbol(reg)] * reg.bitsize)
 
-    def _qualtran_wire_symbols_to_cirq_text(ws: WireSymbol) -> str:
-        if isinstance(ws, Circle):
-            if ws.filled:
-                return '@'
-            else:
-                return '(0)'
-        if isinstance(ws, (TextBox, RarrowTextBox, LarrowTextBox)):
-            return ws.text
-        if isinstance(ws, ModPlus):
-            return 'X'
-        raise NotImplementedError(f"Unknown cirq version of {ws}")
-
     text_symbols = [_qualtran_wire_symbols_to_cirq_text(ws) for ws in wire_symbols]
     return cirq.CircuitDiagramInfo(wire_symbols=text_symbols)
@@ -21,7 +21,7 @@ from attrs import frozen
 
 from qualtran import Bloq, BloqBuilder, ConnectionT, Signature, Soquet, SoquetT
 from qualtran._infra.gate_with_registers import get_named_qubits, merge_qubits
-from qualtran.bloqs.basic_gates import Toffoli, XGate, YGate
+from qualtran.bloqs.basic_gates import Toffoli, TwoBitCSwap, XGate, YGate, ZeroState
 from qualtran.bloqs.cryptography.rsa import ModExp
 from qualtran.bloqs.mcmt.and_bloq import And, MultiAnd
 from qualtran.bloqs.state_preparation import PrepareUniformSuperposition
@@ -105,6 +105,33 @@ class SwapTestWithOnlyTensorData(Bloq):
         return [qtn.Tensor(data=data, inds=inds)]
 
 
+@frozen
+class SwapTwoBitsWithoutTensorsTest(Bloq):
+    """Like `SwapTwoBitsTest`, but exposing only a native cirq op and no tensor data."""
+
+    @property
+    def signature(self):
+        return Signature.build(x=1, y=1)
+
+    def as_cirq_op(
+        self, qubit_manager: cirq.QubitManager, x: CirqQuregT, y: CirqQuregT
+    ) -> Tuple[cirq.Operation, Dict[str, CirqQuregT]]:
+        (x,) = x
+        (y,) = y
+        return cirq.SWAP(x, y), {'x': np.array([x]), 'y': np.array([y])}
+
+
+@frozen
+class SwapWithoutTensorsTest(Bloq):
+    @property
+    def signature(self):
+        return Signature.build(x=1, y=1)
+
+    def build_composite_bloq(self, bb: 'BloqBuilder', x: Soquet, y: Soquet) -> Dict[str, SoquetT]:
+        x, y = bb.add(SwapTwoBitsWithoutTensorsTest(), x=x, y=y)
+        return {'x': x, 'y': y}
+
+
 @pytest.mark.parametrize('n', [1, 2, 3, 4])
 def test_bloq_as_cirq_gate_uses_tensor_data_for_unitary(n: int):
     pytest.importorskip('quimb')
@@ -113,6 +140,24 @@ def test_bloq_as_cirq_gate_uses_tensor_data_for_unitary(n: int):
     np.testing.assert_allclose(unitary_one, unitary_two)
 
 
+def test_has_unitary():
+    # Atomic THRU bloq: answered from the tensor-contraction path.
+    assert cirq.has_unitary(BloqAsCirqGate(TwoBitCSwap()))
+    # Non-THRU but decomposable: the gate acts unitarily on its full qubit set, answered
+    # via cirq's decompose strategy.
+    multi_and = BloqAsCirqGate(MultiAnd(cvs=(1, 1, 1, 1)))
+    assert cirq.has_unitary(multi_and)
+    assert cirq.unitary(multi_and).shape == (128, 128)
+    # Non-THRU and non-decomposable.
+    assert not cirq.has_unitary(BloqAsCirqGate(ZeroState()))
+    # All-THRU with no tensor data anywhere in its decomposition: answered via cirq's
+    # decompose strategy, and stable after unitary() has cached the contraction failure.
+    swap = BloqAsCirqGate(SwapWithoutTensorsTest())
+    assert cirq.has_unitary(swap)
+    np.testing.assert_allclose(cirq.unitary(swap), cirq.unitary(cirq.SWAP))
+    assert cirq.has_unitary(swap)
+
+
 def test_swap():
     swap_circuit = (
         SwapTest(n=5)
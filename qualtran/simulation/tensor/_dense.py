@@ -118,7 +118,11 @@ def quimb_to_dense(
 ) -> NDArray:
     """Contract a quimb tensor network `tn` to a dense matrix consistent with `signature`."""
     inds = _group_outer_inds(tn, signature, superoperator=superoperator)
-    if tn.contraction_width() > 12:
+    # `tn.contraction_width()` runs a full contraction-path optimization, which can dominate
+    # for the small networks common in tests and protocol queries. All indices here are
+    # qubit (dimension-2) indices, so the width is bounded by the total number of distinct
+    # indices; skip the path search when that bound already rules out a wide contraction.
+    if len(tn.ind_map) > 12 and tn.contraction_width() > 12:
         tn.full_simplify(inplace=True)
 
     if inds: